@@ -12,7 +12,9 @@ import argparse
 import logging
 import logging.handlers
 import os
+import queue
 import sys
+import threading
 import webbrowser
 from pathlib import Path
 
@@ -63,13 +65,99 @@ def setup_logging(log_dir: str, level: str):
 def parse_args():
     p = argparse.ArgumentParser(description='Journal Paper Summarizer')
     p.add_argument('--config', help='Config file path', default=None)
-    p.add_argument('--format', help='Override output format (html|md)', default=None)
+    p.add_argument('--format', help='Override output format (html, md, or comma-separated list)', default=None)
     p.add_argument('--journals', nargs='*', help='Specific journal names to process', default=None)
     p.add_argument('--force', action='store_true', help='Ignore previous progress and reprocess all')
     p.add_argument('--dry-run', action='store_true', help='Simulate without translation/output writing')
     return p.parse_args()
 
 
+def run_pipeline(jp, pm, translator, generators, journals, feeds, force=False, dry_run=False):
+    """
+    Run the fetch → extract → translate → render pipeline over all journals.
+
+    Every paper pays its scrape and LLM cost exactly once here, however
+    many renderers are attached; main() only wires the components together.
+
+    Returns:
+        Number of papers processed
+    """
+    logger = logging.getLogger('pipeline')
+    processed_count = 0
+
+    # One-ahead pipeline: a background thread scrapes the next journal's
+    # missing abstracts while the current journal's papers are being
+    # translated, hiding scrape latency behind LLM inference.
+    ready_q: queue.Queue = queue.Queue(maxsize=1)
+
+    def _prefetch_worker():
+        try:
+            for name, url in journals.items():
+                journal_entries = list(jp.iter_papers(name, url, entries=feeds.get(name)))
+                if not force:
+                    # Drop already-processed entries before scraping, or every
+                    # run would re-fetch pages for papers it will then skip.
+                    done = pm.processed_ids(name)
+                    journal_entries = [e for e in journal_entries
+                                       if e.get('id', e.get('link', '')) not in done]
+                jp.prefetch_abstracts(journal_entries, url)
+                ready_q.put((name, url, journal_entries))
+        except BaseException as e:
+            # Hand the error to the consumer; without this the main
+            # thread would block on ready_q.get() forever.
+            ready_q.put(e)
+        else:
+            ready_q.put(None)
+
+    threading.Thread(target=_prefetch_worker, daemon=True).start()
+
+    while True:
+        item = ready_q.get()
+        if item is None:
+            break
+        if isinstance(item, BaseException):
+            raise item
+        journal_name, journal_url, entries = item
+        logger.info(f"{journal_name} 처리 시작")
+        if not dry_run:
+            for og in generators:
+                og.start_journal_section(journal_name)
+        processed_ids = pm.processed_ids(journal_name)
+        pending = []  # (entry_id, paper_info, keywords) awaiting translation
+        for entry in entries:
+            entry_id = entry.get('id', entry.get('link', ''))
+            if not force and entry_id in processed_ids:
+                continue
+            paper_info = jp.extract_paper_info(entry, journal_url)
+            if not paper_info['abstract']:
+                logger.warning(f"초록 없음: {paper_info['title']}")
+                continue
+            keywords = jp.extract_keywords(paper_info['title'], paper_info['abstract'])
+            pending.append((entry_id, paper_info, keywords))
+
+        if dry_run:
+            summaries = [{'english_abstract': p['abstract'], 'korean_summary': '(dry-run)'}
+                         for _, p, _ in pending]
+        else:
+            # Batch interface: providers may overlap round-trips here
+            summaries = translator.translate_batch(
+                [(p['title'], p['abstract']) for _, p, _ in pending])
+        for (entry_id, paper_info, keywords), summary in zip(pending, summaries):
+            if not dry_run:
+                for og in generators:
+                    og.add_paper(paper_info, summary, keywords)
+            pm.add_processed(journal_name, entry_id)
+            processed_count += 1
+        if not dry_run:
+            for og in generators:
+                og.end_journal_section()
+        # Only now that this journal's papers are recorded is it safe to
+        # persist its feed validators for conditional GETs next run.
+        jp.commit_feed_meta(journal_name, journal_url, pm)
+
+    return processed_count
+
+
 def main():
     args = parse_args()
     try:
@@ -85,7 +173,7 @@ def main():
     output_dir = config.get('output_dir', default='output')
 
     translator = build_translator(config)
-    progress_path = config.get('progress', 'file_path', default='data/progress.json')
+    progress_path = config.get('progress', 'file_path', default='data/progress.jsonl')
     pm = ProgressManager(progress_path,
                          backup_count=config.get('progress', 'backup_count', default=5),
                          retention_days=config.get('progress', 'retention_days', default=90))
@@ -98,48 +186,39 @@ def main():
         # filter by provided names
         journals = {k: v for k, v in journals.items() if k in args.journals}
 
-    og = build_output_generator(out_format, output_dir)
+    # Comma-separated formats (e.g. 'html,md') render in a single pass,
+    # so each paper is scraped and translated exactly once.
+    formats = [fmt.strip() for fmt in out_format.split(',') if fmt.strip()]
+    generators = [build_output_generator(fmt, output_dir) for fmt in formats]
     if not args.dry_run:
-        og.start_file()
+        for og in generators:
+            og.start_file()
 
-    processed_count = 0
+    # Prefetch all feeds concurrently; summarisation stays serial since
+    # the translator backend is the bottleneck.
+    feeds = jp.fetch_all_feeds(journals, progress=pm)
 
-    for journal_name, journal_url in journals.items():
-        logger.info(f"{journal_name} 처리 시작")
-        if not args.dry_run:
-            og.start_journal_section(journal_name)
-        entries = list(jp.iter_papers(journal_name, journal_url))
-        for entry in entries:
-            entry_id = entry.get('id', entry.get('link', ''))
-            if not args.force and pm.is_processed(journal_name, entry_id):
-                continue
-            paper_info = jp.extract_paper_info(entry, journal_url)
-            if not paper_info['abstract']:
-                logger.warning(f"초록 없음: {paper_info['title']}")
-                continue
-            keywords = jp.extract_keywords(paper_info['title'], paper_info['abstract'])
-            if args.dry_run:
-                summary = {'english_abstract': paper_info['abstract'], 'korean_summary': '(dry-run)'}
-            else:
-                summary = translator.translate(paper_info['title'], paper_info['abstract'])
-                og.add_paper(paper_info, summary, keywords)
-            pm.add_processed(journal_name, entry_id)
-            processed_count += 1
-        if not args.dry_run:
-            og.end_journal_section()
+    processed_count = run_pipeline(jp, pm, translator, generators, journals, feeds,
+                                   force=args.force, dry_run=args.dry_run)
 
     pm.cleanup()
     pm.save()
     if not args.dry_run:
-        og.end_file()
+        for og in generators:
+            og.end_file()
 
     logger.info(f"처리 완료. 총 처리 논문 수: {processed_count}")
 
-    # Cross-platform file opening
-    if not args.dry_run and og.file_path and os.path.exists(og.file_path):
+    # Cross-platform file opening (primary format only)
+    og = generators[0] if generators else None
+    if not args.dry_run and og and og.file_path and os.path.exists(og.file_path):
         try:
             logger.info(f"Opening output file: {og.file_path}")
-            webbrowser.open('file://' + os.path.abspath(og.file_path))
+            if sys.platform == 'win32':
+                # Direct ShellExecute: no cmd.exe spawn, safe with spaces
+                os.startfile(os.path.abspath(og.file_path))
+            else:
+                webbrowser.open('file://' + os.path.abspath(og.file_path))
         except Exception as e:
             logger.warning(f"Could not open output file automatically: {e}")
             logger.info(f"Output file saved to: {og.file_path}")
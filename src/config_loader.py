@@ -8,8 +8,10 @@ Handles:
 - Providing immutable configuration objects
 """
 
+import functools
 import os
 import yaml
+import jsonschema
 from dataclasses import dataclass, field
 from typing import Any, Dict, Optional
 
@@ -19,6 +21,68 @@ class ConfigError(Exception):
     pass
 
 
+# Declarative schema replacing the hand-written dict-walking validator;
+# compiled into a single validator instance at import time.
+_CONFIG_SCHEMA = {
+    'type': 'object',
+    'required': ['translator'],
+    'properties': {
+        'output_format': {
+            'type': 'string',
+            # comma-separated lists are allowed (e.g. 'html,md')
+            'pattern': r'^\s*(html|md|json)(\s*,\s*(html|md|json))*\s*$'
+        },
+        'translator': {
+            'type': 'object',
+            'required': ['provider'],
+            'properties': {
+                'provider': {'enum': ['ollama', 'llama_cpp', 'openai', 'anthropic']},
+                'timeout': {'type': 'number', 'exclusiveMinimum': 0},
+                'max_retries': {'type': 'integer', 'minimum': 0},
+                'ollama': {
+                    'type': 'object',
+                    'properties': {
+                        'api_url': {'type': 'string', 'pattern': r'^https?://'},
+                        'api_urls': {
+                            'type': 'array', 'minItems': 1,
+                            'items': {'type': 'string', 'pattern': r'^https?://'}
+                        },
+                        'model': {'type': 'string', 'minLength': 1}
+                    }
+                }
+            },
+            'allOf': [{
+                'if': {'properties': {'provider': {'const': 'ollama'}}},
+                'then': {
+                    'required': ['ollama'],
+                    'properties': {'ollama': {
+                        'required': ['model'],
+                        'anyOf': [{'required': ['api_url']},
+                                  {'required': ['api_urls']}]
+                    }}
+                }
+            }]
+        },
+        'journals': {
+            'type': 'object',
+            'properties': {
+                'request_delay': {'type': 'number', 'minimum': 0},
+                'timeout': {'type': 'number', 'exclusiveMinimum': 0}
+            }
+        },
+        'progress': {
+            'type': 'object',
+            'properties': {
+                'backup_count': {'type': 'integer', 'minimum': 0},
+                'retention_days': {'type': 'integer', 'minimum': 0}
+            }
+        }
+    }
+}
+
+_VALIDATOR = jsonschema.Draft7Validator(_CONFIG_SCHEMA)
+
+
 def _deep_merge(base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
     result = dict(base)
     for k, v in override.items():
@@ -57,60 +121,12 @@ def apply_env_overrides(config: Dict[str, Any]) -> Dict[str, Any]:
 
 
 def validate_config(config: Dict[str, Any]) -> None:
-    """Validate configuration file structure and values."""
-    # Translator section
-    if 'translator' not in config:
-        raise ConfigError("'translator' section missing in config")
-
-    provider = config['translator'].get('provider')
-    if provider not in ('ollama', 'llama_cpp', 'openai', 'anthropic'):
-        raise ConfigError(f"Unsupported translator provider: {provider}")
-
-    # Provider-specific validation
-    if provider == 'ollama':
-        ollama = config['translator'].get('ollama', {})
-        if not ollama.get('api_url'):
-            raise ConfigError("translator.ollama.api_url required")
-        if not ollama.get('model'):
-            raise ConfigError("translator.ollama.model required")
-        # Validate URL format
-        api_url = ollama.get('api_url', '')
-        if not api_url.startswith(('http://', 'https://')):
-            raise ConfigError(f"Invalid API URL format: {api_url}")
-
-    # Timeout validation
-    timeout = config.get('translator', {}).get('timeout', 60)
-    if not isinstance(timeout, (int, float)) or timeout <= 0:
-        raise ConfigError(f"translator.timeout must be positive number, got: {timeout}")
-
-    max_retries = config.get('translator', {}).get('max_retries', 3)
-    if not isinstance(max_retries, int) or max_retries < 0:
-        raise ConfigError(f"translator.max_retries must be non-negative integer, got: {max_retries}")
-
-    # Journal section validation
-    if 'journals' in config:
-        request_delay = config['journals'].get('request_delay', 1)
-        if not isinstance(request_delay, (int, float)) or request_delay < 0:
-            raise ConfigError(f"journals.request_delay must be non-negative number, got: {request_delay}")
-
-        journal_timeout = config['journals'].get('timeout', 30)
-        if not isinstance(journal_timeout, (int, float)) or journal_timeout <= 0:
-            raise ConfigError(f"journals.timeout must be positive number, got: {journal_timeout}")
-
-    # Progress section validation
-    if 'progress' in config:
-        backup_count = config['progress'].get('backup_count', 5)
-        if not isinstance(backup_count, int) or backup_count < 0:
-            raise ConfigError(f"progress.backup_count must be non-negative integer, got: {backup_count}")
-
-        retention_days = config['progress'].get('retention_days', 90)
-        if not isinstance(retention_days, int) or retention_days < 0:
-            raise ConfigError(f"progress.retention_days must be non-negative integer, got: {retention_days}")
-
-    # Output format validation
-    output_format = config.get('output_format', 'html')
-    if output_format not in ('html', 'md', 'json'):
-        raise ConfigError(f"Invalid output_format: {output_format}. Must be html, md, or json")
+    """Validate configuration structure and values against the schema."""
+    try:
+        _VALIDATOR.validate(config)
+    except jsonschema.ValidationError as e:
+        path = '.'.join(str(p) for p in e.absolute_path) or '<root>'
+        raise ConfigError(f"Invalid configuration at {path}: {e.message}")
 
 
 @dataclass(frozen=True)
@@ -126,9 +142,17 @@ class AppConfig:
         return ref
 
 
-def load_config(explicit_path: Optional[str] = None) -> AppConfig:
-    path = explicit_path or os.environ.get('CONFIG_PATH') or 'config.yaml'
+@functools.lru_cache(maxsize=4)
+def _load_and_validate(path: str, mtime: float) -> AppConfig:
+    # mtime is part of the cache key so edits to the file bust the cache
     base = load_yaml_config(path)
     base = apply_env_overrides(base)
     validate_config(base)
     return AppConfig(data=base)
+
+
+def load_config(explicit_path: Optional[str] = None) -> AppConfig:
+    path = explicit_path or os.environ.get('CONFIG_PATH') or 'config.yaml'
+    if not os.path.exists(path):
+        raise ConfigError(f"Config file not found: {path}")
+    return _load_and_validate(path, os.path.getmtime(path))
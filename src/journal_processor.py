@@ -9,15 +9,52 @@ This module handles:
 """
 
 import feedparser
+import functools
 import logging
+import os
 import re
+import threading
 import time
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+from urllib3.util.retry import Retry
+import lxml.html
+from lxml import etree
 from bs4 import BeautifulSoup
 from typing import Dict, Any, List, Iterable
 
+try:
+    import ahocorasick  # optional: C-speed multi-pattern matching
+except ImportError:
+    ahocorasick = None
+
 logger = logging.getLogger(__name__)
 
+# The whitelisted academic feeds are trusted and tags are stripped with
+# _TAG_RE before any output anyway, so feedparser's per-entry HTML
+# sanitiser (and relative-URI resolution) is redundant CPU per entry.
+feedparser.SANITIZE_HTML = False
+feedparser.RESOLVE_RELATIVE_URIS = False
+
+# Compiled once; the character class cannot backtrack, unlike r'<.*?>'
+_TAG_RE = re.compile(r'<[^>]*>')
+
+# Sentinel distinguishing 'not cached yet' from a cached None
+_MISS = object()
+
+
+@functools.lru_cache(maxsize=4)
+def _read_journal_list(path: str, mtime: float) -> Dict[str, str]:
+    """Parse a name/URL line-pair file. Cached per (path, mtime) so
+    re-initialised processors in one process never re-read the file."""
+    journals = {}
+    with open(path, 'r', encoding='utf-8') as f:
+        lines = (stripped for line in f if (stripped := line.strip()))
+        for name, url in zip(lines, lines):
+            journals[name] = url
+    return journals
+
 DEFAULT_KEYWORDS = [
     "radiation therapy", "radiotherapy", "dose", "dosimetry", "treatment planning",
     "IMRT", "VMAT", "stereotactic", "brachytherapy", "Monte Carlo", "CT", "MRI",
@@ -46,13 +83,70 @@ class JournalProcessor:
         self.timeout = self.cfg.get('journals', {}).get('timeout', 30)
         self.user_agent = self.cfg.get('journals', {}).get('user_agent', 'PaperSummarizer/1.0')
         self.max_papers = self.cfg.get('journals', {}).get('max_papers_per_journal', 50)
+        self.concurrency = self.cfg.get('journals', {}).get('concurrency', 8)
+        self.scrape_concurrency = self.cfg.get('journals', {}).get('scrape_concurrency', 6)
         self.extractors = self.cfg.get('journals', {}).get('extractors', {})
         self.keywords_enabled = self.cfg.get('keywords', {}).get('enabled', True)
         self.keyword_max = self.cfg.get('keywords', {}).get('max_count', 5)
         custom_terms = self.cfg.get('keywords', {}).get('custom_terms', []) or []
         self.keyword_terms = [*DEFAULT_KEYWORDS, *custom_terms]
+        # (original, lowercase) pairs so no per-call lowering is needed
+        self._kw_pairs = [(term, term.lower()) for term in self.keyword_terms]
+        # Single-pass keyword matcher: Aho-Corasick automaton when the C
+        # extension is available, otherwise one compiled alternation regex.
+        # Both replace the per-term substring scan over the full text.
+        if ahocorasick is not None:
+            self._kw_automaton = ahocorasick.Automaton()
+            for term in self.keyword_terms:
+                self._kw_automaton.add_word(term.lower(), term.lower())
+            self._kw_automaton.make_automaton()
+            self._kw_re = None
+        else:
+            self._kw_automaton = None
+            self._kw_re = re.compile(
+                '|'.join(map(re.escape, sorted(self.keyword_terms, key=len, reverse=True))),
+                re.IGNORECASE)
         self.session = requests.Session()
         self.session.headers.update({'User-Agent': self.user_agent})
+        # Pooled adapter so parallel scrapes reuse TCP/TLS connections;
+        # retry transient gateway errors at the transport level. Pool size
+        # tracks the scrape concurrency so workers never block on sockets.
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=self.scrape_concurrency,
+            pool_maxsize=self.scrape_concurrency * 2,
+            max_retries=Retry(total=3, backoff_factor=0.5,
+                              status_forcelist=[502, 503, 504]))
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self._abstract_cache: Dict[str, str] = {}
+        self._feed_meta: Dict[str, Dict[str, str]] = {}
+        self._domain_cache: Dict[str, Any] = {}
+        # Per-host politeness gate: request_delay applies per netloc so
+        # parallel workers never hammer one publisher, while requests to
+        # different hosts proceed unthrottled.
+        self._host_lock = threading.Lock()
+        self._host_next: Dict[str, float] = {}
+        self._xpaths = {key: self._compile_xpath(extractor)
+                        for key, extractor in self.extractors.items()}
+
+    @staticmethod
+    def _compile_xpath(extractor: Dict[str, str]):
+        """
+        Compile an extractor definition into a reusable lxml XPath.
+
+        Returns None for selector-type extractors, which fall back to
+        BeautifulSoup CSS selection.
+        """
+        selector = extractor.get('selector', '')
+        etype = extractor.get('type', 'class')
+        if etype == 'class':
+            class_name = selector.replace('div.', '', 1) if selector.startswith('div.') else selector
+            return etree.XPath(
+                "//div[contains(concat(' ', normalize-space(@class), ' '), ' %s ')]" % class_name)
+        if etype == 'id':
+            id_name = selector.replace('div#', '', 1) if selector.startswith('div#') else selector
+            return etree.XPath("//div[@id='%s']" % id_name)
+        return None
 
     def load_journals(self, list_file: str) -> Dict[str, str]:
         """
@@ -64,13 +158,8 @@ class JournalProcessor:
         Returns:
             Dictionary mapping journal names to RSS feed URLs
         """
-        journals = {}
         try:
-            with open(list_file, 'r', encoding='utf-8') as f:
-                lines = [l.strip() for l in f.readlines() if l.strip()]
-            for i in range(0, len(lines), 2):
-                if i + 1 < len(lines):
-                    journals[lines[i]] = lines[i+1]
+            journals = _read_journal_list(list_file, os.path.getmtime(list_file))
         except FileNotFoundError:
             logger.warning(f"Journal list file not found: {list_file}; using embedded defaults")
             journals = {
@@ -84,16 +173,130 @@ class JournalProcessor:
             }
         return journals
 
-    def parse_feed(self, url: str):
-        feed = feedparser.parse(url)
+    def _polite_wait(self, url: str) -> None:
+        """Sleep as needed so requests to one host are request_delay apart."""
+        if self.request_delay <= 0:
+            return
+        host = urlsplit(url).netloc
+        with self._host_lock:
+            now = time.monotonic()
+            ready = max(now, self._host_next.get(host, now))
+            self._host_next[host] = ready + self.request_delay
+        if ready > now:
+            time.sleep(ready - now)
+
+    def parse_feed(self, url: str, feed_meta: Dict[str, str] = None):
+        # Fetch through the pooled session and hand feedparser the raw
+        # stream: XML is parsed as bytes arrive instead of buffering the
+        # whole feed first, and keep-alive/UA headers apply to feeds too.
+        # Known validators turn unchanged feeds into a cheap 304.
+        headers = {}
+        if feed_meta:
+            if feed_meta.get('etag'):
+                headers['If-None-Match'] = feed_meta['etag']
+            if feed_meta.get('last_modified'):
+                headers['If-Modified-Since'] = feed_meta['last_modified']
+        try:
+            self._polite_wait(url)
+            with self.session.get(url, stream=True, timeout=self.timeout,
+                                  headers=headers) as resp:
+                if resp.status_code == 304:
+                    logger.info(f"Feed unchanged (304): {url}")
+                    return []
+                resp.raise_for_status()
+                meta = {'etag': resp.headers.get('ETag'),
+                        'last_modified': resp.headers.get('Last-Modified')}
+                if any(meta.values()):
+                    self._feed_meta[url] = meta
+                resp.raw.decode_content = True
+                feed = feedparser.parse(resp.raw)
+        except requests.RequestException as e:
+            logger.warning(f"Feed fetch failed for {url}: {e}")
+            return []
         return feed.entries[: self.max_papers]
 
+    def fetch_all_feeds(self, journals: Dict[str, str], progress=None) -> Dict[str, list]:
+        """
+        Fetch all journal feeds concurrently.
+
+        Feed fetching is network-bound, so a thread pool turns the total
+        fetch time from the sum of round-trips into roughly the slowest one.
+        When a ProgressManager is given, its stored ETag/Last-Modified
+        validators are sent so unchanged feeds short-circuit with a 304.
+        Fresh validators are only captured here; the pipeline persists
+        them via commit_feed_meta once a journal's papers are processed.
+
+        Args:
+            journals: Dictionary mapping journal names to RSS feed URLs
+            progress: Optional ProgressManager holding feed validators
+
+        Returns:
+            Dictionary mapping journal names to lists of feed entries
+        """
+        def fetch_one(item):
+            name, url = item
+            meta = progress.get_feed_meta(name) if progress else None
+            return self.parse_feed(url, feed_meta=meta)
+
+        workers = min(self.concurrency, max(1, len(journals)))
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            results = dict(zip(journals.keys(), ex.map(fetch_one, journals.items())))
+        return results
+
+    def commit_feed_meta(self, name: str, url: str, progress) -> None:
+        """
+        Persist the validators captured for a feed, once its papers are
+        fully processed.
+
+        Writing them any earlier would let a crash between fetch and
+        translation leave fresh validators on disk: the next run would
+        get a 304 and silently skip the still-unprocessed papers.
+        """
+        meta = self._feed_meta.get(url)
+        if meta:
+            progress.set_feed_meta(name, meta)
+
     def extract_keywords(self, title: str, abstract: str) -> List[str]:
         if not self.keywords_enabled:
             return []
         combined = (title + ' ' + abstract).lower()
-        found = [kw for kw in self.keyword_terms if kw.lower() in combined]
-        return found[: self.keyword_max]
+        if self._kw_automaton is not None:
+            hits = {term for _, term in self._kw_automaton.iter(combined)}
+        else:
+            hits = {m.group(0).lower() for m in self._kw_re.finditer(combined)}
+        # Preserve the configured term ordering; stop as soon as the
+        # per-paper cap is filled rather than ranking every hit.
+        found = []
+        for kw, kw_lower in self._kw_pairs:
+            if kw_lower in hits:
+                found.append(kw)
+                if len(found) >= self.keyword_max:
+                    break
+        return found
+
+    def prefetch_abstracts(self, entries, journal_url: str) -> None:
+        """
+        Fetch missing abstracts for a batch of entries in parallel.
+
+        Entries whose feed summary is empty need a page scrape; doing those
+        scrapes through a bounded thread pool before the translation loop
+        collapses N serial round-trips into roughly one. Results land in an
+        internal cache that extract_paper_info reads.
+
+        Args:
+            entries: Feed entries for one journal
+            journal_url: RSS feed URL (used to pick the extractor)
+        """
+        links = [entry.get('link', '') for entry in entries
+                 if not (entry.get('summary', '') or '') and entry.get('link', '')
+                 and entry.get('link', '') not in self._abstract_cache]
+        if not links:
+            return
+        domain_key = self.resolve_extractor(journal_url)
+        workers = min(self.scrape_concurrency, len(links))
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            results = ex.map(lambda link: self._extract_abstract_from_page(link, domain_key), links)
+            self._abstract_cache.update(zip(links, results))
 
     def extract_paper_info(self, entry, journal_url: str) -> Dict[str, str]:
         title = entry.get('title', '제목 없음')
@@ -101,9 +304,17 @@ class JournalProcessor:
         published = entry.get('published', '') or entry.get('updated', '')
         abstract = entry.get('summary', '') or ''
         if not abstract and link:
-            abstract = self._extract_abstract_from_page(link, journal_url)
+            if link in self._abstract_cache:
+                abstract = self._abstract_cache.pop(link)
+            else:
+                abstract = self._extract_abstract_from_page(
+                    link, self.resolve_extractor(journal_url))
         if abstract:
-            abstract = re.sub(r'<.*?>', '', abstract).strip()
+            # Most scraped abstracts are already plain text; skip the
+            # regex pass entirely unless markup is present.
+            if '<' in abstract:
+                abstract = _TAG_RE.sub('', abstract)
+            abstract = abstract.strip()
         return {
             'title': title,
             'link': link,
@@ -111,58 +322,71 @@ class JournalProcessor:
             'abstract': abstract
         }
 
-    def _extract_abstract_from_page(self, link: str, journal_url: str) -> str:
+    def resolve_extractor(self, journal_url: str):
         """
-        Extract abstract from journal article webpage.
+        Resolve the extractor key for a feed URL, cached per URL.
 
-        Args:
-            link: URL of the article
-            journal_url: RSS feed URL to determine which extractor to use
+        The feed URL is identical for every paper of a journal, so the
+        match is computed once and reused; lookup is by netloc suffix
+        with a substring fallback for keys appearing in the URL path.
 
         Returns:
-            Extracted abstract text or empty string if extraction fails
+            Matching extractor key or None
         """
+        domain_key = self._domain_cache.get(journal_url, _MISS)
+        if domain_key is not _MISS:
+            return domain_key
+        netloc = urlsplit(journal_url).netloc
         domain_key = None
         for key in self.extractors:
-            if key in journal_url:
+            if netloc == key or netloc.endswith('.' + key) or key in journal_url:
                 domain_key = key
                 break
+        self._domain_cache[journal_url] = domain_key
+        return domain_key
+
+    def _extract_abstract_from_page(self, link: str, domain_key) -> str:
+        """
+        Extract abstract from journal article webpage.
+
+        Args:
+            link: URL of the article
+            domain_key: Extractor key from resolve_extractor
+
+        Returns:
+            Extracted abstract text or empty string if extraction fails
+        """
         if not domain_key:
-            logger.debug(f"No extractor for journal: {journal_url}")
+            logger.debug(f"No extractor for page: {link}")
             return ''
 
-        extractor = self.extractors[domain_key]
         try:
+            self._polite_wait(link)
             resp = self.session.get(link, timeout=self.timeout)
-            soup = BeautifulSoup(resp.text, 'html.parser')
-            selector = extractor.get('selector', '')
-            etype = extractor.get('type', 'class')
-
-            # Robust selector parsing
-            elem = None
-            if etype == 'class':
-                # Remove 'div.' prefix if present, otherwise use as-is
-                class_name = selector.replace('div.', '', 1) if selector.startswith('div.') else selector
-                elem = soup.find('div', class_=class_name)
-            elif etype == 'id':
-                # Remove 'div#' prefix if present, otherwise use as-is
-                id_name = selector.replace('div#', '', 1) if selector.startswith('div#') else selector
-                elem = soup.find('div', id=id_name)
+            xpath = self._xpaths.get(domain_key)
+            if xpath is not None:
+                # Pass resp.content (bytes) so lxml can sniff the page
+                # encoding itself; the XPath is compiled once at init.
+                tree = lxml.html.fromstring(resp.content)
+                nodes = xpath(tree)
+                if nodes:
+                    return nodes[0].text_content().strip()
             else:
-                # Fallback: use CSS selector directly
+                # Fallback: use CSS selector directly via BeautifulSoup
+                selector = self.extractors[domain_key].get('selector', '')
+                soup = BeautifulSoup(resp.content, 'lxml')
                 elem = soup.select_one(selector)
-
-            if elem:
-                return elem.get_text().strip()
+                if elem:
+                    return elem.get_text().strip()
         except Exception as e:
             logger.warning(f"Abstract extraction failed for {link}: {e}")
         return ''
 
-    def iter_papers(self, journal_name: str, journal_url: str):
-        entries = self.parse_feed(journal_url)
+    def iter_papers(self, journal_name: str, journal_url: str, entries=None):
+        if entries is None:
+            entries = self.parse_feed(journal_url)
         total = len(entries)
         logger.info(f"{journal_name}: 총 {total}개 항목")
         for idx, entry in enumerate(entries, 1):
             logger.info(f"{journal_name}: {idx}/{total} 처리 중")
             yield entry
-            time.sleep(self.request_delay)
@@ -3,23 +3,130 @@ Output generation module for creating formatted reports.
 
 Supports multiple output formats (HTML, Markdown) with a common interface.
 Each format generator handles file creation, section management, and styling.
+Fragments are handed to a background writer thread through a bounded
+queue, so the pipeline never blocks on disk I/O; the file is opened once
+per run.
 """
 
 import datetime
+import logging
 import os
+import queue
+import threading
+from html import escape
 from abc import ABC, abstractmethod
 from typing import Dict, Any, List
 
+logger = logging.getLogger(__name__)
+
+_HTML_HEAD = '''<!DOCTYPE html><html><head><meta charset="UTF-8"><title>논문 요약 보고서</title><style>
+body { font-family: Arial, sans-serif; line-height: 1.6; margin: 0; padding: 20px; color: #333; }
+h1 { color: #2c3e50; text-align: center; margin-bottom: 30px; }
+h2 { color: #3498db; border-bottom: 2px solid #3498db; padding-bottom: 5px; margin-top: 30px; cursor: pointer; }
+h2:after { content: " ▼"; font-size: 0.8em; }
+h2.collapsed:after { content: " ▶"; font-size: 0.8em; }
+h3 { color: #2c3e50; margin-top: 20px; }
+.paper { background-color: #f9f9f9; border-left: 5px solid #3498db; padding: 15px; margin-bottom: 25px; border-radius: 0 5px 5px 0; }
+.meta { color: #7f8c8d; margin: 10px 0; font-size: 0.9em; }
+.abstract { margin: 15px 0; text-align: justify; }
+.summary { background-color: #eef9fd; padding: 15px; border-radius: 5px; margin-top: 15px; }
+a { color: #3498db; text-decoration: none; }
+a:hover { text-decoration: underline; }
+.journal-content { display: block; }
+.collapsed + .journal-content { display: none; }
+</style><script>document.addEventListener('DOMContentLoaded',function(){document.querySelectorAll('h2').forEach(function(h){h.addEventListener('click',function(){this.classList.toggle('collapsed');var c=this.nextElementSibling;if(c&&c.classList.contains('journal-content')){c.style.display=this.classList.contains('collapsed')?'none':'block';}});});});</script></head><body><h1>논문 요약 보고서</h1>'''
+
+
+# Paper fragment templates, built once at import; add_paper fills them
+# via format_map instead of assembling a fresh literal per call.
+_PAPER_HTML = (
+    '<div class="paper"><h3>{title}</h3><div class="meta">'
+    '<span>출판일: {published}</span> '
+    '<span>링크: <a href="{link}" target="_blank">원문 보기</a></span></div>'
+    '<div class="abstract"><h4>영문 초록</h4><p>{english_abstract}</p>'
+    '<h4>한글 요약</h4><p>{korean_summary}</p>{kw_html}</div></div>'
+)
+_KW_HTML_PREFIX = '<p>키워드: '
+_KW_HTML_SUFFIX = '</p>'
+
+_PAPER_MD = (
+    '### {title}\n- [ ] **{title}**\n**출판일:** {published}\n\n'
+    '<details>\n<summary>-내용보기-</summary>\n\n'
+    '**링크:** [{link}]({link})\n**키워드:** {kw_md}\n\n'
+    '**영문 초록**\n{english_abstract}\n\n'
+    '**한글 요약**\n{korean_summary}\n\n</details>\n\n'
+)
+
+
 class BaseOutputGenerator(ABC):
     """
     Abstract base class for output generators.
 
     Defines the interface that all output format generators must implement.
+    Subclasses append fragments via _write; a dedicated writer thread
+    drains them to disk, so producers only pay a queue put. The bounded
+    queue applies back-pressure if the disk ever falls far behind.
     """
+
+    # Queue markers: flush the OS buffer / stop the writer thread
+    _FLUSH = object()
+    _CLOSE = object()
+
     def __init__(self, output_dir: str):
         self.output_dir = output_dir
         os.makedirs(self.output_dir, exist_ok=True)
         self.file_path = None
+        self._fh = None
+        self._q: queue.Queue = queue.Queue(maxsize=128)
+        self._writer = None
+        self._write_error = None  # first writer-thread failure, raised in _close
+
+    def _open(self, file_name: str) -> None:
+        self.file_path = os.path.join(self.output_dir, file_name)
+        self._fh = open(self.file_path, 'w', encoding='utf-8', buffering=1 << 20)
+        self._writer = threading.Thread(target=self._drain, daemon=True)
+        self._writer.start()
+
+    def _drain(self) -> None:
+        while True:
+            item = self._q.get()
+            try:
+                if item is self._CLOSE:
+                    self._fh.flush()
+                    return
+                if item is self._FLUSH:
+                    self._fh.flush()
+                    continue
+                self._fh.write(item)
+            except Exception as e:
+                # Keep consuming so producers never block on the bounded
+                # queue; the first error is re-raised from _close.
+                if self._write_error is None:
+                    self._write_error = e
+                    logger.error(f"Output write failed, discarding further fragments: {e}")
+                if item is self._CLOSE:
+                    return
+
+    def _write(self, fragment: str) -> None:
+        self._q.put(fragment)
+
+    def _flush(self) -> None:
+        self._q.put(self._FLUSH)
+
+    def _close(self) -> None:
+        if self._fh is not None:
+            self._q.put(self._CLOSE)
+            self._writer.join()
+            try:
+                self._fh.close()
+            except Exception as e:
+                if self._write_error is None:
+                    self._write_error = e
+            self._fh = None
+            if self._write_error is not None:
+                # The report on disk is incomplete; fail the run rather
+                # than pretend the output was written.
+                raise self._write_error
 
     @abstractmethod
     def start_file(self):
@@ -44,67 +151,53 @@ class BaseOutputGenerator(ABC):
 class HtmlGenerator(BaseOutputGenerator):
     def start_file(self):
         today = datetime.datetime.now().strftime('%Y%m%d')
-        self.file_path = os.path.join(self.output_dir, f"papers_summary_{today}.html")
-        with open(self.file_path, 'w', encoding='utf-8') as f:
-            f.write(f'''<!DOCTYPE html><html><head><meta charset="UTF-8"><title>논문 요약 보고서</title><style>
-body {{ font-family: Arial, sans-serif; line-height: 1.6; margin: 0; padding: 20px; color: #333; }}
-h1 {{ color: #2c3e50; text-align: center; margin-bottom: 30px; }}
-h2 {{ color: #3498db; border-bottom: 2px solid #3498db; padding-bottom: 5px; margin-top: 30px; cursor: pointer; }}
-h2:after {{ content: " ▼"; font-size: 0.8em; }}
-h2.collapsed:after {{ content: " ▶"; font-size: 0.8em; }}
-h3 {{ color: #2c3e50; margin-top: 20px; }}
-.paper {{ background-color: #f9f9f9; border-left: 5px solid #3498db; padding: 15px; margin-bottom: 25px; border-radius: 0 5px 5px 0; }}
-.meta {{ color: #7f8c8d; margin: 10px 0; font-size: 0.9em; }}
-.abstract {{ margin: 15px 0; text-align: justify; }}
-.summary {{ background-color: #eef9fd; padding: 15px; border-radius: 5px; margin-top: 15px; }}
-a {{ color: #3498db; text-decoration: none; }}
-a:hover {{ text-decoration: underline; }}
-.journal-content {{ display: block; }}
-.collapsed + .journal-content {{ display: none; }}
-</style><script>document.addEventListener('DOMContentLoaded',function(){document.querySelectorAll('h2').forEach(function(h){h.addEventListener('click',function(){this.classList.toggle('collapsed');var c=this.nextElementSibling;if(c&&c.classList.contains('journal-content')){c.style.display=this.classList.contains('collapsed')?'none':'block';}});});});</script></head><body><h1>논문 요약 보고서</h1><p>생성 일시: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>''')
+        self._open(f"papers_summary_{today}.html")
+        self._write(_HTML_HEAD)
+        self._write(f'''<p>생성 일시: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>''')
+        self._flush()
 
     def start_journal_section(self, journal_name: str):
-        with open(self.file_path, 'a', encoding='utf-8') as f:
-            f.write(f'\n<h2>{journal_name}</h2>\n<div class="journal-content">\n')
+        self._write(f'\n<h2>{journal_name}</h2>\n<div class="journal-content">\n')
 
     def add_paper(self, paper_info: Dict[str, Any], summary: Dict[str, str], keywords):
-        with open(self.file_path, 'a', encoding='utf-8') as f:
-            kw_html = ''
-            if keywords:
-                kw_html = '<p>키워드: ' + ', '.join(keywords) + '</p>'
-            f.write(f'''<div class="paper"><h3>{paper_info['title']}</h3><div class="meta"><span>출판일: {paper_info['published']}</span> <span>링크: <a href="{paper_info['link']}" target="_blank">원문 보기</a></span></div><div class="abstract"><h4>영문 초록</h4><p>{summary['english_abstract']}</p><h4>한글 요약</h4><p>{summary['korean_summary']}</p>{kw_html}</div></div>''')
+        kw_html = ''
+        if keywords:
+            kw_html = _KW_HTML_PREFIX + escape(', '.join(keywords)) + _KW_HTML_SUFFIX
+        # Escape each field exactly once; titles/abstracts containing '<'
+        # or '&' would otherwise break the markup.
+        fields = {k: escape(v or '') for k, v in {**paper_info, **summary}.items()}
+        fields['kw_html'] = kw_html
+        self._write(_PAPER_HTML.format_map(fields))
 
     def end_journal_section(self):
-        with open(self.file_path, 'a', encoding='utf-8') as f:
-            f.write('</div>')
+        self._write('</div>')
+        self._flush()
 
     def end_file(self):
-        with open(self.file_path, 'a', encoding='utf-8') as f:
-            f.write('</body></html>')
+        self._write('</body></html>')
+        self._close()
 
 class MarkdownGenerator(BaseOutputGenerator):
     def start_file(self):
         today = datetime.datetime.now().strftime('%Y%m%d')
-        self.file_path = os.path.join(self.output_dir, f"papers_summary_{today}.md")
-        with open(self.file_path, 'w', encoding='utf-8') as f:
-            f.write(f"""# 논문 요약 보고서\n\n**생성 일시:** {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n---\n\n""")
+        self._open(f"papers_summary_{today}.md")
+        self._write(f"""# 논문 요약 보고서\n\n**생성 일시:** {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n---\n\n""")
+        self._flush()
 
     def start_journal_section(self, journal_name: str):
-        with open(self.file_path, 'a', encoding='utf-8') as f:
-            f.write(f"\n## {journal_name}\n\n<details>\n<summary>논문 목록 보기</summary>\n\n")
+        self._write(f"\n## {journal_name}\n\n<details>\n<summary>논문 목록 보기</summary>\n\n")
 
     def add_paper(self, paper_info: Dict[str, Any], summary: Dict[str, str], keywords):
         kw_md = ', '.join([f'`{k}`' for k in keywords]) if keywords else '없음'
-        with open(self.file_path, 'a', encoding='utf-8') as f:
-            f.write(f"""### {paper_info['title']}\n- [ ] **{paper_info['title']}**\n**출판일:** {paper_info['published']}\n\n<details>\n<summary>-내용보기-</summary>\n\n**링크:** [{paper_info['link']}]({paper_info['link']})\n**키워드:** {kw_md}\n\n**영문 초록**\n{summary['english_abstract']}\n\n**한글 요약**\n{summary['korean_summary']}\n\n</details>\n\n""")
+        self._write(_PAPER_MD.format_map({**paper_info, **summary, 'kw_md': kw_md}))
 
     def end_journal_section(self):
-        with open(self.file_path, 'a', encoding='utf-8') as f:
-            f.write('\n</details>\n\n---\n\n')
+        self._write('\n</details>\n\n---\n\n')
+        self._flush()
 
     def end_file(self):
-        with open(self.file_path, 'a', encoding='utf-8') as f:
-            f.write('\n---\n\n**요약 작업 완료**\n')
+        self._write('\n---\n\n**요약 작업 완료**\n')
+        self._close()
 
 
 def build_output_generator(fmt: str, output_dir: str) -> BaseOutputGenerator:
@@ -6,6 +6,12 @@ Handles:
 - Preventing duplicate processing
 - Progress file backup and recovery
 - Automatic cleanup of old records
+
+Storage is append-only JSONL: every processed paper (and feed-validator
+update) is persisted as one line the moment it happens, so a crash loses
+nothing and the per-event write cost is O(1) instead of a full-file
+rewrite. cleanup() compacts the log back to one state line per journal,
+which is also when backups rotate.
 """
 
 import json
@@ -13,18 +19,40 @@ import shutil
 import os
 import time
 import logging
+
+try:
+    import orjson  # optional: C-speed JSON for the growing progress file
+except ImportError:
+    orjson = None
 from datetime import datetime, timedelta
 from typing import Dict, Any, List
 
 logger = logging.getLogger(__name__)
 
+# Shared read-only default so lookup misses allocate nothing.
+# processed_ids maps are used as insertion-ordered sets (dict keys):
+# O(1) membership, and truncation can keep the most recent entries.
+_EMPTY_SET = frozenset()
+
+
+def _loads(raw):
+    return orjson.loads(raw) if orjson else json.loads(raw)
+
+
+def _dump_line(rec: Dict[str, Any]) -> str:
+    if orjson is not None:
+        return orjson.dumps(rec).decode('utf-8')
+    return json.dumps(rec, ensure_ascii=False, separators=(',', ':'))
+
+
 class ProgressManager:
     """
     Manages progress tracking for paper processing.
 
     Features:
-    - Atomic writes to prevent corruption
-    - Automatic backup rotation
+    - Incremental per-event persistence (JSONL append)
+    - Atomic compaction to prevent corruption
+    - Automatic backup rotation on compact
     - Recovery from corrupted files
     - Retention policy for old records
     """
@@ -34,29 +62,119 @@ class ProgressManager:
         self.retention_days = retention_days
         os.makedirs(os.path.dirname(file_path), exist_ok=True)
         self._data: Dict[str, Any] = {}
+        self._append_fh = None
+        self._now_cache = None  # (monotonic, iso_str) refreshed at 1 s granularity
         self.load()
 
+    def _now_iso(self) -> str:
+        """Current time as ISO string, cached for up to one second.
+
+        The timestamps only feed a day-granularity retention policy, so
+        sub-second staleness is irrelevant and the per-paper
+        datetime.now().isoformat() cost is avoided."""
+        now = time.monotonic()
+        if self._now_cache is None or now - self._now_cache[0] > 1.0:
+            self._now_cache = (now, datetime.now().isoformat())
+        return self._now_cache[1]
+
+    def _journal(self, name: str) -> Dict[str, Any]:
+        return self._data.setdefault(name, {
+            'last_processed': None,
+            'processed_ids': {},
+            'last_success': None,
+            'error_count': 0
+        })
+
+    def _apply_record(self, rec: Dict[str, Any]) -> None:
+        name = rec.get('j')
+        if not name:
+            return
+        if 'state' in rec:
+            # Compacted snapshot line: replaces any prior state
+            state = dict(rec['state'])
+            if isinstance(state.get('processed_ids'), list):
+                state['processed_ids'] = dict.fromkeys(state['processed_ids'])
+            self._data[name] = state
+            return
+        j = self._journal(name)
+        if 'id' in rec:
+            j['processed_ids'][rec['id']] = None
+            ts = rec.get('ts')
+            if ts:
+                j['last_processed'] = ts
+                j['last_success'] = ts
+        if 'meta' in rec:
+            j['feed_meta'] = rec['meta']
+
+    def _load_lines(self, path: str) -> bool:
+        """Replay a JSONL progress log into memory. Returns True if any
+        record was applied; a torn final line is tolerated."""
+        applied = False
+        with open(path, 'rb') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    rec = _loads(line)
+                except Exception:
+                    logger.warning(f"Skipping corrupt progress line in {path}")
+                    continue
+                self._apply_record(rec)
+                applied = True
+        return applied
+
     def load(self) -> None:
+        self._data = {}
         if not os.path.exists(self.file_path):
-            self._data = {}
+            self._load_legacy()
             return
         try:
-            with open(self.file_path, 'r', encoding='utf-8') as f:
-                self._data = json.load(f)
+            applied = self._load_lines(self.file_path)
+            if not applied and os.path.getsize(self.file_path) > 0:
+                # Non-empty file with no readable record: treat as corrupt
+                raise ValueError("no valid progress records")
         except Exception as e:
             logger.error(f"Failed to load progress file, attempting recovery: {e}")
             self._recover_from_backup()
 
-    def _recover_from_backup(self):
+    def _load_legacy(self) -> None:
+        """Migrate from the old single-JSON progress file if present."""
+        root, ext = os.path.splitext(self.file_path)
+        legacy_path = root + '.json'
+        if ext != '.jsonl' or not os.path.exists(legacy_path):
+            return
+        try:
+            with open(legacy_path, 'rb') as f:
+                self._data = _loads(f.read())
+            for info in self._data.values():
+                if isinstance(info.get('processed_ids'), list):
+                    info['processed_ids'] = dict.fromkeys(info['processed_ids'])
+            logger.info(f"Migrated legacy progress file: {legacy_path}")
+            self.compact()
+        except Exception as e:
+            logger.error(f"Failed to migrate legacy progress file: {e}")
+            self._data = {}
+
+    def _backup_paths(self):
+        """Backup file paths, newest first by mtime (robust against any
+        future change to the timestamp format in the name)."""
         dir_path = os.path.dirname(self.file_path)
-        base = os.path.basename(self.file_path)
-        backups = [f for f in os.listdir(dir_path) if f.startswith(base + '.')]
-        backups.sort(reverse=True)
-        for b in backups:
+        prefix = os.path.basename(self.file_path) + '.'
+        found = []
+        with os.scandir(dir_path) as it:
+            for entry in it:
+                if entry.name.startswith(prefix) and entry.name.endswith('.bak'):
+                    found.append((entry.stat().st_mtime, entry.path))
+        found.sort(reverse=True)
+        return [path for _, path in found]
+
+    def _recover_from_backup(self):
+        for path in self._backup_paths():
             try:
-                with open(os.path.join(dir_path, b), 'r', encoding='utf-8') as f:
-                    self._data = json.load(f)
-                    logger.info(f"Recovered progress from backup {b}")
+                self._data = {}
+                if self._load_lines(path):
+                    logger.info(f"Recovered progress from backup {os.path.basename(path)}")
                     return
             except Exception:
                 continue
@@ -67,54 +185,97 @@ class ProgressManager:
         base = os.path.basename(self.file_path)
         timestamp = datetime.now().strftime('%Y%m%d%H%M%S')
         backup_name = f"{base}.{timestamp}.bak"
-        shutil.copy2(self.file_path, os.path.join(dir_path, backup_name))
-        backups = [f for f in os.listdir(dir_path) if f.startswith(base + '.')]
-        backups.sort(reverse=True)
-        for old in backups[self.backup_count:]:
+        backup_path = os.path.join(dir_path, backup_name)
+        try:
+            # compact() replaces the log via os.replace, so the old inode
+            # lives on behind this link: an O(1) backup instead of a copy.
+            os.link(self.file_path, backup_path)
+        except OSError:
+            # Filesystems without hard links (e.g. some Windows setups)
+            shutil.copy2(self.file_path, backup_path)
+        for old in self._backup_paths()[self.backup_count:]:
             try:
-                os.remove(os.path.join(dir_path, old))
+                os.remove(old)
             except OSError:
                 pass
 
-    def save(self) -> None:
+    def _append(self, rec: Dict[str, Any]) -> None:
+        try:
+            if self._append_fh is None:
+                self._append_fh = open(self.file_path, 'a', encoding='utf-8', buffering=1)
+            self._append_fh.write(_dump_line(rec) + '\n')
+        except Exception as e:
+            logger.error(f"Failed to append progress record: {e}")
+
+    def compact(self) -> None:
+        """
+        Rewrite the log as one snapshot line per journal, atomically.
+
+        This is the only full-file write; it rotates a backup of the old
+        log first and reuses temp-file + os.replace for atomicity.
+        """
+        if self._append_fh is not None:
+            self._append_fh.close()
+            self._append_fh = None
         temp_path = self.file_path + '.tmp'
         try:
             if os.path.exists(self.file_path):
                 self._rotate_backups()
+            lines = []
+            for journal, info in self._data.items():
+                # Keep insertion (processing) order in the snapshot
+                state = {**info, 'processed_ids': list(info.get('processed_ids', ()))}
+                lines.append(_dump_line({'j': journal, 'state': state}))
             with open(temp_path, 'w', encoding='utf-8') as f:
-                json.dump(self._data, f, ensure_ascii=False, indent=2)
+                f.write(''.join(line + '\n' for line in lines))
             os.replace(temp_path, self.file_path)
         except Exception as e:
-            logger.error(f"Failed to save progress: {e}")
+            logger.error(f"Failed to compact progress: {e}")
             if os.path.exists(temp_path):
                 try:
                     os.remove(temp_path)
                 except OSError:
                     pass
 
+    def save(self) -> None:
+        """Flush pending append writes. Events are already persisted as
+        they happen; the full rewrite only occurs in compact()."""
+        if self._append_fh is not None:
+            self._append_fh.flush()
+
     def is_processed(self, journal: str, paper_id: str) -> bool:
         j = self._data.get(journal, {})
-        return paper_id in j.get('processed_ids', [])
+        return paper_id in j.get('processed_ids', _EMPTY_SET)
+
+    def processed_ids(self, journal: str):
+        """Return the set of processed IDs for a journal, for hoisting
+        membership checks out of per-entry loops."""
+        return self._data.get(journal, {}).get('processed_ids', _EMPTY_SET)
 
     def add_processed(self, journal: str, paper_id: str) -> None:
-        j = self._data.setdefault(journal, {
-            'last_processed': None,
-            'processed_ids': [],
-            'last_success': None,
-            'error_count': 0
-        })
+        j = self._journal(journal)
+        now_iso = self._now_iso()
         if paper_id not in j['processed_ids']:
-            j['processed_ids'].append(paper_id)
-        j['last_processed'] = datetime.now().isoformat()
-        j['last_success'] = datetime.now().isoformat()
+            j['processed_ids'][paper_id] = None
+            self._append({'j': journal, 'id': paper_id, 'ts': now_iso})
+        j['last_processed'] = now_iso
+        j['last_success'] = now_iso
+
+    def get_feed_meta(self, journal: str) -> Dict[str, Any]:
+        return self._data.get(journal, {}).get('feed_meta', {})
+
+    def set_feed_meta(self, journal: str, meta: Dict[str, Any]) -> None:
+        self._journal(journal)['feed_meta'] = meta
+        self._append({'j': journal, 'meta': meta})
 
     def cleanup(self):
         cutoff = datetime.now() - timedelta(days=self.retention_days)
         for journal, info in list(self._data.items()):
-            processed = info.get('processed_ids', [])
-            # simple retention: keep last 100 ids (configurable if needed)
+            processed = info.get('processed_ids', {})
+            # simple retention: keep the 500 most recently processed ids;
+            # insertion order makes the tail the newest entries
             if len(processed) > 500:
-                info['processed_ids'] = processed[-500:]
+                info['processed_ids'] = dict.fromkeys(list(processed)[-500:])
             # remove journal if no activity beyond retention
             last = info.get('last_processed')
             if last:
@@ -125,6 +286,7 @@ class ProgressManager:
                         del self._data[journal]
                 except ValueError:
                     continue
+        self.compact()
 
     def get_state(self) -> Dict[str, Any]:
         return self._data